@@ -19,6 +19,17 @@ from test_framework.wallet_util import bytes_to_wif
 CHALLENGE_PRIVATE_KEY = (42).to_bytes(32, 'big')
 
 
+def get_challenge_script():
+    """Return the signet challenge (simple p2wpkh script) for CHALLENGE_PRIVATE_KEY"""
+    privkey = ECKey()
+    privkey.set(CHALLENGE_PRIVATE_KEY, True)
+    pubkey = privkey.get_pubkey().get_bytes()
+    return key_to_p2wpkh_script(pubkey)
+
+
+CHALLENGE_SCRIPT = get_challenge_script()
+
+
 class SignetMinerTest(BitcoinTestFramework):
     def add_options(self, parser):
         self.add_wallet_options(parser)
@@ -28,12 +39,7 @@ class SignetMinerTest(BitcoinTestFramework):
         self.setup_clean_chain = True
         self.num_nodes = 1
 
-        # generate and specify signet challenge (simple p2wpkh script)
-        privkey = ECKey()
-        privkey.set(CHALLENGE_PRIVATE_KEY, True)
-        pubkey = privkey.get_pubkey().get_bytes()
-        challenge = key_to_p2wpkh_script(pubkey)
-        self.extra_args = [[f'-signetchallenge={challenge.hex()}']]
+        self.extra_args = [[f'-signetchallenge={CHALLENGE_SCRIPT.hex()}']]
 
     def skip_test_if_missing_module(self):
         self.skip_if_no_cli()
@@ -46,20 +52,27 @@ class SignetMinerTest(BitcoinTestFramework):
         node.importprivkey(bytes_to_wif(CHALLENGE_PRIVATE_KEY))
 
         # generate block with signet miner tool
+        miner_address = node.getnewaddress()
+        self.mine_block(node, miner_address)
+        assert_equal(node.getblockcount(), 1)
+
+    def mine_block(self, node, address):
         base_dir = self.config["environment"]["SRCDIR"]
         signet_miner_path = os.path.join(base_dir, "contrib", "signet", "miner")
-        subprocess.run([
+        miner = subprocess.run([
                 sys.executable,
                 signet_miner_path,
                 f'--cli={node.cli.binary} -datadir={node.cli.datadir}',
                 'generate',
-                f'--address={node.getnewaddress()}',
+                f'--address={address}',
                 f'--grind-cmd={self.options.bitcoinutil} grind',
                 '--nbits=1d00ffff',
                 f'--set-block-time={int(time.time())}',
                 '--poolnum=99',
-            ], check=True, stderr=subprocess.STDOUT)
-        assert_equal(node.getblockcount(), 1)
+            ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        self.log.debug(f"Signet miner output:\n{miner.stdout}")
+        if miner.returncode != 0:
+            raise AssertionError(f"Signet miner failed with exit code {miner.returncode}:\n{miner.stdout}")
 
 
 if __name__ == "__main__":